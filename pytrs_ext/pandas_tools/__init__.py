@@ -5,6 +5,7 @@ Misc. tools for extending pyTRS functionality to pandas.
 """
 
 from .pandas_tools import (
+    PLSSDescCache,
     parse_tracts,
     parse_plssdescs,
     filter_by_trs,
@@ -4,11 +4,81 @@
 Misc. tools for extending pyTRS functionality to pandas.
 """
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+
 import pytrs
+import numpy as np
 import pandas as pd
 
 
-def parse_tracts(df: pd.DataFrame, tract_col: str, suffix="_parsed") -> pd.DataFrame:
+class PLSSDescCache:
+    """
+    A cache of parsed pytrs.PLSSDesc objects, so that the same PLSS land
+    description does not get parsed more than once (e.g., in duplicated
+    rows, or in `filter_by_trs()` followed by `parse_plssdescs()`). Pass
+    the same cache as `cache=` to each function call that should share
+    it, and call `.clear()` (or simply discard the cache) to release the
+    parsed objects:
+
+    >>> cache = PLSSDescCache()
+    >>> filtered_df = filter_by_trs(
+    ...     df, plss_col='land_desc', trs='154n97w14', cache=cache)
+    >>> parsed_df = parse_plssdescs(
+    ...     filtered_df, plss_col='land_desc', cache=cache)
+    >>> cache.clear()
+
+    Note: The cached objects are shared, so they should not be modified.
+    """
+
+    def __init__(self):
+        self._parsed = {}
+
+    def __len__(self):
+        return len(self._parsed)
+
+    def clear(self):
+        """Remove all parsed PLSS descriptions from the cache."""
+        self._parsed.clear()
+
+    def get(self, plssdesc_raw, config=None, parse_qq=False):
+        """
+        Get the pytrs.PLSSDesc object for the unparsed PLSS land
+        description, parsing it (and storing it in the cache) only if it
+        has not already been parsed with the same config.
+
+        :param plssdesc_raw: An unparsed PLSS land description.
+        :param config: (Optional) A pytrs.Config object or config
+        parameters (see pytrs.Config docs for details).
+        :param parse_qq: Whether the QQs need to be parsed. (If they do
+        not, an object whose QQs were parsed may still be returned.)
+        :return: A pytrs.PLSSDesc object.
+        """
+        config = _normalize_config(config)
+        return self._get(plssdesc_raw, config, _config_key(config), parse_qq)
+
+    def _get(self, plssdesc_raw, config, config_key, parse_qq):
+        """
+        Same as `.get()`, but `config` must already be normalized with
+        `_normalize_config()`, and `config_key` is its `_config_key()`.
+        """
+        key = (plssdesc_raw, config_key, True)
+        dsc = self._parsed.get(key)
+        if dsc is None and not parse_qq:
+            key = (plssdesc_raw, config_key, False)
+            dsc = self._parsed.get(key)
+        if dsc is None:
+            dsc = pytrs.PLSSDesc(plssdesc_raw, parse_qq=parse_qq, config=config)
+            self._parsed[key] = dsc
+        return dsc
+
+
+def parse_tracts(
+        df: pd.DataFrame, tract_col: str, suffix="_parsed", parallel=False,
+        max_workers=None) -> pd.DataFrame:
     """
     Parse PLSS tracts in a pandas DataFrame, into lots and QQs.
     NOTE: May only use this if the description block is separated from
@@ -26,6 +96,13 @@ def parse_tracts(df: pd.DataFrame, tract_col: str, suffix="_parsed") -> pd.DataF
     :param suffix: The suffix to be added to the column headers (will
     only apply if the attempted headers already exist in the DataFrame).
     Defaults to "_parsed" (if needed at all).
+    :param parallel: (Optional) Whether to divide the parsing among
+    multiple worker processes. Defaults to False, in which case all
+    tracts are parsed sequentially in the current process.
+    :param max_workers: (Optional) If `parallel=True`, the maximum number
+    of worker processes to use. Defaults to None, in which case as many
+    processes as there are CPUs are used (as with
+    `concurrent.futures.ProcessPoolExecutor`).
     :return: The same DataFrame with added columns for the parsed PLSS
     data.
     """
@@ -37,30 +114,38 @@ def parse_tracts(df: pd.DataFrame, tract_col: str, suffix="_parsed") -> pd.DataF
     headers = ["lots", "qqs", "warning_flags", "error_flags"]
 
     # Parse the tract in each row into a pytrs.Tract object, and extract
-    # the relevant data to a list of dicts. Note that the attributes
-    # being extracted here are all lists of strings (by design of pytrs).
-    # So we'll eventually ", ".join() on them before writing them to the
-    # DataFrame.
-    parsed_tracts = [
-        pytrs.Tract(row[tract_col], parse_qq=True).to_dict(atts)
-        for _, row in df.iterrows()
+    # the relevant data to a dict for each tract (yielded one at a time).
+    # Note that the attributes being extracted here are all lists of
+    # strings (by design of pytrs). So we'll eventually ", ".join() on
+    # them before writing them to the DataFrame.
+    tract_values = df[tract_col].to_numpy(copy=False)
+    parsed_tracts = _map_parse(
+        partial(_parse_tract, atts=atts), tract_values,
+        parallel=parallel, max_workers=max_workers)
+
+    # Assemble the parsed data into columns (all of them list-type), as
+    # each tract is parsed.
+    cols = _transpose(parsed_tracts, atts)
+    ndf = _assemble_columns(cols, atts, headers, list_type_atts=atts)
+
+    # If a header already exists in the DataFrame, we'll add the suffix.
+    existing = set(df.columns)
+    final_headers = [
+        f"{header}{suffix}" if header in existing else header
+        for header in headers
     ]
 
-    # Add a column for each parsed attribute.
-    for header, att in zip(headers, atts):
-        if header in df.columns:
-            # If the header already exists in the DataFrame, we'll add
-            # the suffix.
-            header = f"{header}{suffix}"
-
-        # Extract the relevant data for each tract and add it as a new column
-        df[header] = [", ".join(dct[att]) for dct in parsed_tracts]
+    # Add the joined data for each parsed attribute as a new column (in
+    # place, since the caller may rely on `df` itself being modified).
+    for header, final_header in zip(headers, final_headers):
+        df[final_header] = ndf[header].to_numpy()
 
     return df
 
 
 def parse_plssdescs(
-        df: pd.DataFrame, plss_col: str, suffix="_parsed", config=None) -> pd.DataFrame:
+        df: pd.DataFrame, plss_col: str, suffix="_parsed", config=None,
+        parallel=False, max_workers=None, cache=None) -> pd.DataFrame:
     """
     Parse PLSS land descriptions in a pandas DataFrame, adding new rows
     as necessary. Returns a new DataFrame.
@@ -74,6 +159,17 @@ def parse_plssdescs(
     :param suffix: The suffix to add to the added column headers.
     :param config: (Optional) A pytrs.Config object or config parameters
     (see pytrs.Config docs for details).
+    :param parallel: (Optional) Whether to divide the parsing among
+    multiple worker processes. Defaults to False, in which case all
+    descriptions are parsed sequentially in the current process.
+    :param max_workers: (Optional) If `parallel=True`, the maximum number
+    of worker processes to use. Defaults to None, in which case as many
+    processes as there are CPUs are used (as with
+    `concurrent.futures.ProcessPoolExecutor`).
+    :param cache: (Optional) A `PLSSDescCache` object, from which to get
+    any descriptions that were already parsed (e.g., by a previous call
+    to `filter_by_trs()` with the same cache), and into which to store
+    newly parsed descriptions. (Not used if `parallel=True`.)
     :return: A new DataFrame with added rows and columns for the parsed
     PLSS data.
     """
@@ -96,38 +192,42 @@ def parse_plssdescs(
     # adding to the DataFrame).
     list_type_atts = ["lots", "qqs", "w_flags", "e_flags"]
 
-    parsed_tracts = []
-    for ind, row in df.iterrows():
-        # Parse the PLSS description in this row. Specify `source=ind`
-        # so that each parsed description knows the row it came from (so
-        # we can `pd.merge()` on that column later).
-        dsc = pytrs.PLSSDesc(
-            row[plss_col], parse_qq=True, config=config, source=ind)
-
-        # Extract the tract data into a list of dicts, and tack them onto
-        # the end of parsed_descs
-        parsed_tracts.extend(dsc.tracts_to_dict(atts))
+    # Build the pytrs.Config object only once, rather than for every row.
+    config = _normalize_config(config)
+    config_key = _config_key(config)
+
+    # Parse the PLSS description in each row, and extract the tract data
+    # into a list of dicts for each row (yielded one row at a time).
+    plss_values = df[plss_col].to_numpy(copy=False)
+    if parallel:
+        # The cache cannot be shared with worker processes.
+        cache = None
+    parsed_rows = _map_parse(
+        partial(
+            _parse_plssdesc, config=config, atts=atts, cache=cache,
+            config_key=config_key),
+        df.index, plss_values, parallel=parallel, max_workers=max_workers)
+
+    # Transpose the tract data from all rows into a list of values for
+    # each attribute, as each row is parsed (so that the dicts don't all
+    # need to be held in memory at once).
+    parsed_tracts = chain.from_iterable(parsed_rows)
+    cols = _transpose(parsed_tracts, atts)
 
     # Create a new DataFrame from the parsed data.
-    ndf = pd.DataFrame()
-    def same(x): return x
-    def join(x): return ", ".join(x)
-    for att, header in zip(atts, headers):
-        func = same
-        if att in list_type_atts:
-            func = join
-        ndf[header] = [func(dct[att]) for dct in parsed_tracts]
+    ndf = _assemble_columns(cols, atts, headers, list_type_atts)
+    ndf.set_index("ind", inplace=True)
 
-    ndf = ndf.set_index("ind")
-
-    # Merge our original DataFrame to the new one, and return the result
-    return pd.merge(
-        df, ndf, left_index=True, right_index=True, suffixes=("", suffix))
+    # Join our original DataFrame to the new one (on the index), and
+    # return the result. Any new headers that already exist in the
+    # original DataFrame get the suffix.
+    return df.join(ndf, how="inner", rsuffix=suffix)
 
 
 def filter_by_trs(
         df: pd.DataFrame, plss_col: str, trs, include=True, config=None,
-        match_all=False) -> pd.DataFrame:
+        match_all=False, parallel=False, max_workers=None,
+        cache=None) -> pd.DataFrame:
     """
     Filter a pandas DataFrame containing unparsed PLSS land descriptions
     to those rows that contain the specified Twp/Rge/Sec (TRS).
@@ -163,14 +263,73 @@ def filter_by_trs(
     duplicates).  Defaults to False (i.e. a match of ANY Twp/Rge/Sec
     will be interpreted as True).
 
+    Note: Rows whose PLSS land description is missing (None or NaN) are
+    treated as not containing any TRS -- i.e. they are excluded when
+    `include=True`, and kept when `include=False`.
+
+    :param parallel: (Optional) Whether to divide the parsing among
+    multiple worker processes. Defaults to False, in which case all
+    descriptions are parsed sequentially in the current process.
+
+    :param max_workers: (Optional) If `parallel=True`, the maximum number
+    of worker processes to use. Defaults to None, in which case as many
+    processes as there are CPUs are used (as with
+    `concurrent.futures.ProcessPoolExecutor`).
+
+    :param cache: (Optional) A `PLSSDescCache` object, from which to get
+    any descriptions that were already parsed, and into which to store
+    newly parsed descriptions. If passed, descriptions are parsed with
+    QQs, so that a subsequent call to `parse_plssdescs()` with the same
+    cache does not need to parse them again. (Not used if
+    `parallel=True`.)
+
     :return: A filtered DataFrame.
     """
+    # Compile the sought TRS's only once, rather than for every row.
+    sought_trs_list = pytrs.TRSList(trs)
+    sought_trs = _sought_trs_set(sought_trs_list)
+    # Likewise build the pytrs.Config object only once.
+    config = _normalize_config(config)
+    config_key = _config_key(config)
+
+    def contains(plssdesc_raw):
+        return _plssdesc_contains_trs(
+            plssdesc_raw, sought_trs, config, match_all, cache, config_key)
+
+    # Rule out the rows whose raw text cannot possibly contain any of
+    # the sought TRS's, so that we only need to parse the candidates.
+    plss_values = df[plss_col]
+    candidates = _prefilter_candidates(plss_values, sought_trs_list, config)
+    if candidates is not None:
+        plss_values = plss_values[candidates]
+
+    if not parallel:
+        # Apply the predicate to each value in the underlying array.
+        predicate = np.frompyfunc(contains, 1, 1)
+        results = predicate(plss_values.to_numpy(copy=False)).astype(bool)
+    else:
+        # Send the sought TRS's to each worker process only once (when
+        # it is initialized), rather than with every row.
+        plss_values = plss_values.tolist()
+        results = _map_parse(
+            _contains_worker, plss_values, parallel=True,
+            max_workers=max_workers, initializer=_init_contains_worker,
+            initargs=(sought_trs, config, match_all))
+        results = np.fromiter(results, dtype=bool, count=len(plss_values))
+
+    if candidates is None:
+        mask = results
+    else:
+        mask = np.zeros(len(df), dtype=bool)
+        mask[candidates] = results
     if not include:
-        return df[~df[plss_col].apply(plssdesc_contains_trs, args=(trs, config, match_all))]
-    return df[df[plss_col].apply(plssdesc_contains_trs, args=(trs, config, match_all))]
+        return df[~mask]
+    return df[mask]
 
 
-def plssdesc_contains_trs(plssdesc_raw: str, trs, config=None, match_all=False) -> bool:
+def plssdesc_contains_trs(
+        plssdesc_raw: str, trs, config=None, match_all=False,
+        cache=None) -> bool:
     """
     Whether the unparsed PLSS land description contains the specified
     township/range/section (TRS).
@@ -193,16 +352,294 @@ def plssdesc_contains_trs(plssdesc_raw: str, trs, config=None, match_all=False)
     duplicates).  Defaults to False (i.e. a match of ANY Twp/Rge/Sec
     will be interpreted as True).
 
+    :param cache: (Optional) A `PLSSDescCache` object (see the same
+    parameter in `filter_by_trs()`).
+
     :return: A bool, whether or not the TRS is found in the PLSS
-    description.
+    description. (Always False if `plssdesc_raw` is None or NaN.)
+    """
+    sought_trs = _sought_trs_set(pytrs.TRSList(trs))
+    config = _normalize_config(config)
+    return _plssdesc_contains_trs(
+        plssdesc_raw, sought_trs, config, match_all, cache,
+        _config_key(config))
+
+
+def _sought_trs_set(sought_trs_list) -> frozenset:
+    """
+    Convert a pytrs.TRSList into a frozenset of Twp/Rge/Sec strings, for
+    use as `sought_trs` in `_plssdesc_contains_trs()`.
+    """
+    return frozenset(trs.trs for trs in sought_trs_list)
+
+
+def _plssdesc_contains_trs(
+        plssdesc_raw: str, sought_trs, config=None, match_all=False,
+        cache=None, config_key=None) -> bool:
+    """
+    Whether the unparsed PLSS land description contains the Twp/Rge/Sec
+    in `sought_trs`, which must be a frozenset of Twp/Rge/Sec strings
+    (as returned by `_sought_trs_set()`). The config must already be
+    normalized with `_normalize_config()` (and if a `cache` is used,
+    `config_key` must be its `_config_key()`). QQs are parsed only if a
+    `cache` is used (so that they can be reused later). A missing description (None
+    or NaN) never contains any TRS.
+    """
+    if pd.api.types.is_scalar(plssdesc_raw) and pd.isna(plssdesc_raw):
+        return False
+    dsc = _parse_desc(
+        plssdesc_raw, config, parse_qq=cache is not None, cache=cache,
+        config_key=config_key)
+    found_trs = (tract.trs for tract in dsc.tracts)
+    if match_all:
+        return sought_trs.issubset(set(found_trs))
+    # Stop at the first match.
+    return any(trs in sought_trs for trs in found_trs)
+
+
+def _transpose(parsed_tracts, atts) -> dict:
+    """
+    Transpose the parsed data into a dict of lists, keyed by attribute.
+
+    :param parsed_tracts: An iterable of dicts of parsed data (one per
+    tract). These are consumed one at a time, and not retained.
+    :param atts: The attributes (keys) to extract from each dict.
+    :return: A dict of lists of values, keyed by attribute.
+    """
+    cols = {att: [] for att in atts}
+    appenders = [(att, cols[att].append) for att in atts]
+    for dct in parsed_tracts:
+        for att, append in appenders:
+            append(dct[att])
+    return cols
+
+
+def _assemble_columns(cols, atts, headers, list_type_atts) -> pd.DataFrame:
+    """
+    Assemble the transposed parsed data into a new DataFrame, with one
+    column per attribute. The values in the list-type columns are
+    joined with ", ".
+
+    :param cols: A dict of lists of values, keyed by attribute (as
+    returned by `_transpose()`).
+    :param atts: The attributes to include in the new DataFrame.
+    :param headers: The corresponding headers for the new DataFrame.
+    :param list_type_atts: The attributes whose values are lists.
+    :return: A new DataFrame (with a default index).
+    """
+    data = {}
+    for att, header in zip(atts, headers):
+        if att in list_type_atts:
+            # (`.str.join()` always returns `object` dtype, so let pandas
+            # infer the dtype as it would for any other list of strings.)
+            data[header] = pd.Series(
+                cols[att], dtype=object).str.join(", ").infer_objects()
+        else:
+            data[header] = cols[att]
+    return pd.DataFrame(data)
+
+
+def _parse_tract(tract_raw, atts):
+    """
+    Parse a single PLSS tract into a pytrs.Tract object, and return a
+    dict of the requested attributes.
+    """
+    return pytrs.Tract(tract_raw, parse_qq=True).to_dict(atts)
+
+
+def _parse_plssdesc(
+        ind, plssdesc_raw, config, atts, cache=None, config_key=None):
+    """
+    Parse a single PLSS land description into a pytrs.PLSSDesc object,
+    and return a list of dicts of the requested attributes (one dict per
+    resulting tract). Set `'source'` to `ind` so that each parsed
+    tract knows the row it came from (so we can join on that column
+    later). The config must already be normalized with
+    `_normalize_config()` (and if a `cache` is used, `config_key` must be
+    its `_config_key()`).
+    """
+    dsc = _parse_desc(
+        plssdesc_raw, config, parse_qq=True, cache=cache,
+        config_key=config_key)
+    tract_dicts = dsc.tracts_to_dict(atts)
+    if 'source' in atts:
+        # The cached PLSSDesc may be shared between rows, so we set the
+        # source on the extracted data instead.
+        for dct in tract_dicts:
+            dct['source'] = ind
+    return tract_dicts
+
+
+def _parse_desc(
+        plssdesc_raw, config, parse_qq=False, cache=None, config_key=None):
+    """
+    Parse a PLSS land description into a pytrs.PLSSDesc object, or get
+    it from the `cache` (a `PLSSDescCache` object), if one is passed.
+
+    :param plssdesc_raw: An unparsed PLSS land description (a string).
+    :param config: A pytrs.Config object or None (as returned by
+    `_normalize_config()`).
+    :param parse_qq: Whether the QQs need to be parsed.
+    :param cache: (Optional) A `PLSSDescCache` object.
+    :param config_key: The `_config_key()` of `config` (only needed if
+    a `cache` is passed).
+    """
+    if cache is not None:
+        return cache._get(plssdesc_raw, config, config_key, parse_qq)
+    return pytrs.PLSSDesc(plssdesc_raw, parse_qq=parse_qq, config=config)
+
+
+def _normalize_config(config):
+    """
+    Get the pytrs.Config object to parse with: the object itself, if
+    `config` is already a pytrs.Config object; otherwise a new one built
+    from the config parameters (or None, if `config` is None).
+    """
+    if config is None or isinstance(config, pytrs.Config):
+        return config
+    return pytrs.Config(config)
+
+
+def _config_key(config):
+    """
+    Convert a pytrs.Config object (or None) into a hashable equivalent,
+    for use as a cache key. (The key is not used for parsing.)
+    """
+    if config is None:
+        return None
+    return config.decompile_to_text()
+
+
+def _prefilter_candidates(plss_values, sought_trs, config):
+    """
+    Determine which of the raw PLSS land descriptions could possibly
+    contain one of the Twp/Rge/Sec in `sought_trs` (see
+    `_trs_prefilter()`).
+
+    :param plss_values: A pandas Series of unparsed PLSS land
+    descriptions.
+    :param sought_trs: A pytrs.TRSList.
+    :param config: A pytrs.Config object or None (as returned by
+    `_normalize_config()`).
+    :return: A numpy array of bools (True for each candidate), or None
+    if the descriptions cannot be prefiltered (in which case all of them
+    must be parsed).
+    """
+    if not (pd.api.types.is_object_dtype(plss_values)
+            or pd.api.types.is_string_dtype(plss_values)):
+        # The `.str` accessor only works on string values.
+        return None
+    if _config_may_rewrite_twprge(config):
+        return None
+    prefilter = _trs_prefilter(sought_trs)
+    if prefilter is None:
+        return None
+    return plss_values.str.contains(
+        prefilter, regex=True, na=False).to_numpy(dtype=bool)
+
+
+def _config_may_rewrite_twprge(config) -> bool:
+    """
+    Whether the pytrs.Config object (or None) may cause pytrs to rewrite
+    the text before parsing it, such that a Twp/Rge could be found even
+    though its numbers do not appear in the raw text (e.g., `ocr_scrub`,
+    which reads 'T l54N' as 'T154N').
+    """
+    if config is None:
+        return False
+    if getattr(config, 'ocr_scrub', False):
+        return True
+    return 'ocr_scrub' in _config_key(config)
+
+
+def _trs_prefilter(sought_trs):
+    """
+    Compile a regex pattern that matches any raw PLSS land description
+    that could possibly contain one of the Twp/Rge/Sec in `sought_trs`
+    -- i.e. the township number and range number of at least one of
+    them appear in the text as standalone numbers (allowing for leading
+    zeros). Any text that does not match can be ruled out without
+    parsing it -- but only if the config will not rewrite the text
+    before parsing it (see `_config_may_rewrite_twprge()`).
+
+    :param sought_trs: A pytrs.TRSList.
+    :return: A compiled `re.Pattern`, or None if no prefilter can be
+    built (e.g., if any of the sought TRS's is an error or undefined).
+    """
+    alternatives = []
+    for twprge in dict.fromkeys(trs.twprge for trs in sought_trs):
+        nums = re.findall(r"\d+", twprge or "")
+        if len(nums) != 2:
+            return None
+        # Require both numbers to appear, in either order.
+        alternatives.append("".join(
+            rf"(?=.*?(?<!\d)0*{int(num)}(?!\d))" for num in nums))
+    if not alternatives:
+        return None
+    return re.compile(rf"^(?:{'|'.join(alternatives)})", re.DOTALL)
+
+
+# The arguments for `_contains_worker()`, as set in each worker process
+# by `_init_contains_worker()`.
+_contains_worker_kwargs = {}
+
+
+def _init_contains_worker(sought_trs, config, match_all):
+    """
+    Store the arguments for `_contains_worker()` in a worker process.
+    """
+    _contains_worker_kwargs['sought_trs'] = sought_trs
+    _contains_worker_kwargs['config'] = config
+    _contains_worker_kwargs['match_all'] = match_all
+
+
+def _contains_worker(plssdesc_raw) -> bool:
+    """
+    Call `_plssdesc_contains_trs()` on the unparsed PLSS land description,
+    using the arguments stored by `_init_contains_worker()`.
+    """
+    return _plssdesc_contains_trs(plssdesc_raw, **_contains_worker_kwargs)
+
+
+def _map_parse(
+        func, *iterables, parallel=False, max_workers=None,
+        initializer=None, initargs=()):
+    """
+    Apply `func` across the `iterables` (as with the builtin `map()`),
+    and return an iterator over the results, in order. If
+    `parallel=True`, the work is divided among up to `max_workers`
+    worker processes (or as many processes as there are CPUs, if
+    `max_workers` is None), each of which is first set up by calling
+    `initializer(*initargs)`, if specified.
+    """
+    if not parallel:
+        return map(func, *iterables)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    elif not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(
+            f"`max_workers` must be a positive integer or None; "
+            f"got {max_workers!r}")
+    return _map_processes(
+        func, iterables, max_workers, initializer, initargs)
+
+
+def _map_processes(func, iterables, max_workers, initializer, initargs):
+    """
+    Yield the results of `func` across the `iterables`, as computed by a
+    pool of `max_workers` worker processes. (See `_map_parse()`.)
     """
-    sought_trs = pytrs.TRSList(trs)
-    dsc = pytrs.PLSSDesc(plssdesc_raw, config=config)
-    found_trs = pytrs.TRSList(dsc)
-    return found_trs.contains(sought_trs, match_all=match_all)
+    # Send the work to each process in reasonably large chunks, to keep
+    # the pickling overhead down.
+    chunksize = max(1, len(iterables[0]) // (4 * max_workers))
+    with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=initializer,
+            initargs=initargs) as executor:
+        yield from executor.map(func, *iterables, chunksize=chunksize)
 
 
 __all__ = [
+    PLSSDescCache,
     parse_tracts,
     parse_plssdescs,
     filter_by_trs,
@@ -215,12 +215,14 @@ def trs_list_to_format_a(
         if found and handle_errors == 'raise':
             raise ValueError(
                 f"Encountered {len(found)} error/undefined Twp/Rge/Sec.")
-    # Rely on built-in OrderedDict to remember insertion order.
-    from collections import OrderedDict
-    grouped = trs_list.group_by(attribute='twprge', into=OrderedDict())
+    # Group the sections by Twp/Rge in a single pass, relying on dicts
+    # to remember insertion order.
+    grouped = {}
+    for trs in trs_list:
+        grouped.setdefault(trs.twprge, []).append(trs.sec.lstrip('0'))
     components = [
-        f"{twprge} - {sec_delimiter.join([trs.sec.lstrip('0') for trs in lst])}"
-        for twprge, lst in grouped.items()
+        f"{twprge} - {sec_delimiter.join(secs)}"
+        for twprge, secs in grouped.items()
     ]
     return twprge_delimiter.join(components)
 
@@ -0,0 +1,9 @@
+import sys
+
+try:
+    import pytrs
+except ImportError:
+    # Fall back to the stand-in, so that `pytrs_ext.pandas_tools` can be
+    # imported. (The tests patch in the stand-in regardless.)
+    from tests import fake_pytrs
+    sys.modules['pytrs'] = fake_pytrs
@@ -0,0 +1,84 @@
+"""
+A minimal stand-in for the parts of pytrs used by `pytrs_ext.pandas_tools`,
+so that the pandas-side behavior can be tested without depending on
+pyTRS's parser.
+
+A 'PLSS description' here is a string of ';'-separated tracts, each in
+the format '<trs>: <desc>' (e.g., '154n97w14: L1 NE/4; 154n97w15: SW/4').
+Lots are 'L<n>' tokens, and QQs/quarters are any tokens ending in '/4'.
+"""
+
+import re
+
+# How many times each class has been instantiated (reset by the tests).
+PARSE_COUNTS = {'PLSSDesc': 0, 'Tract': 0}
+
+
+class Config:
+    def __init__(self, config_text=None):
+        if isinstance(config_text, Config):
+            config_text = config_text.decompile_to_text()
+        self.params = [
+            p.strip() for p in (config_text or '').split(',') if p.strip()]
+        self.ocr_scrub = 'ocr_scrub' in self.params
+
+    def decompile_to_text(self):
+        return ','.join(self.params)
+
+
+class Tract:
+    def __init__(self, desc, trs='', parse_qq=False, source=None):
+        PARSE_COUNTS['Tract'] += 1
+        self.desc = desc
+        self.trs = trs
+        self.twp, self.rge, self.sec = _split_trs(trs)
+        self.source = source
+        self.lots = re.findall(r"\bL\d+\b", desc)
+        self.qqs = re.findall(r"\b\S+/4\b", desc) if parse_qq else []
+        self.w_flags = []
+        self.e_flags = [] if trs or not source else ['no_trs']
+
+    def to_dict(self, atts):
+        return {att: getattr(self, att) for att in atts}
+
+
+class PLSSDesc:
+    def __init__(self, txt, config=None, parse_qq=False, source=None):
+        if not isinstance(txt, str):
+            raise TypeError(f"Cannot parse {txt!r}")
+        PARSE_COUNTS['PLSSDesc'] += 1
+        self.config = config
+        self.parse_qq = parse_qq
+        self.source = source
+        self.tracts = []
+        for chunk in txt.split(';'):
+            trs, _, desc = chunk.strip().partition(': ')
+            if trs:
+                self.tracts.append(
+                    Tract(desc, trs=trs, parse_qq=parse_qq, source=source))
+
+    def tracts_to_dict(self, atts):
+        return [tract.to_dict(atts) for tract in self.tracts]
+
+
+class TRS:
+    def __init__(self, trs):
+        self.trs = trs
+        twp, rge, sec = _split_trs(trs)
+        self.twprge = f"{twp}{rge}" if twp and rge else None
+        self.sec = sec
+
+
+class TRSList(list):
+    def __init__(self, trs_list=()):
+        if isinstance(trs_list, (str, TRS)):
+            trs_list = [trs_list]
+        super().__init__(
+            trs if isinstance(trs, TRS) else TRS(trs) for trs in trs_list)
+
+
+def _split_trs(trs):
+    mo = re.fullmatch(r"(\d{1,3}[ns])(\d{1,3}[ew])(\d{2})", trs or '')
+    if mo is None:
+        return None, None, None
+    return mo.groups()
@@ -0,0 +1,260 @@
+"""
+Tests for `pytrs_ext.pandas_tools`, run against a minimal stand-in for
+pytrs (see `fake_pytrs.py`).
+"""
+
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pytrs_ext.pandas_tools import pandas_tools
+from pytrs_ext.pandas_tools import filter_by_trs
+from tests import fake_pytrs
+
+
+@pytest.fixture(autouse=True)
+def use_fake_pytrs(monkeypatch):
+    monkeypatch.setattr(pandas_tools, 'pytrs', fake_pytrs)
+    for cls_name in fake_pytrs.PARSE_COUNTS:
+        fake_pytrs.PARSE_COUNTS[cls_name] = 0
+
+
+PLSS_DF = pd.DataFrame(
+    {
+        'land_desc': [
+            '154n97w14: L1 NE/4; 154n97w15: SW/4',
+            '155n98w01: SE/4',
+            '154n97w14: NW/4',
+            '154n97w15: L2 L3',
+        ],
+        'other': [1, 2, 3, 4],
+    },
+    index=[10, 20, 30, 40])
+
+
+# Prefilter.
+
+def test_no_prefilter_with_ocr_scrub():
+    plss_values = pd.Series(['T l54N-R97W Sec 14: NE/4'])
+    sought = fake_pytrs.TRSList('154n97w14')
+    for config in ('ocr_scrub', 'n,w,ocr_scrub'):
+        config = fake_pytrs.Config(config)
+        assert pandas_tools._prefilter_candidates(
+            plss_values, sought, config) is None
+
+
+def test_no_prefilter_for_non_string_column():
+    plss_values = pd.Series([np.nan, np.nan])
+    assert plss_values.dtype == float
+    sought = fake_pytrs.TRSList('154n97w14')
+    assert pandas_tools._prefilter_candidates(plss_values, sought, None) is None
+
+
+def test_prefilter_rules_out_other_twprge():
+    plss_values = pd.Series([
+        "T154N-R97W Sec 14: NE/4",
+        "T155N-R97W Sec 14: NE/4",
+        "T0154N-R097W Sec 14: NE/4",
+    ])
+    sought = fake_pytrs.TRSList('154n97w14')
+    candidates = pandas_tools._prefilter_candidates(plss_values, sought, None)
+    assert list(candidates) == [True, False, True]
+
+
+# filter_by_trs() end-to-end (prefiltered rows merged back into the mask).
+
+def test_filter_by_trs_include():
+    filtered = filter_by_trs(PLSS_DF, 'land_desc', '154n97w14')
+    assert list(filtered.index) == [10, 30]
+    # Only the candidates that survived the prefilter were parsed.
+    assert fake_pytrs.PARSE_COUNTS['PLSSDesc'] == 3
+
+
+def test_filter_by_trs_exclude():
+    filtered = filter_by_trs(
+        PLSS_DF, 'land_desc', '154n97w14', include=False)
+    assert list(filtered.index) == [20, 40]
+
+
+def test_filter_by_trs_match_all():
+    sought = ['154n97w14', '154n97w15']
+    filtered = filter_by_trs(PLSS_DF, 'land_desc', sought, match_all=True)
+    assert list(filtered.index) == [10]
+    filtered = filter_by_trs(
+        PLSS_DF, 'land_desc', sought, match_all=True, include=False)
+    assert list(filtered.index) == [20, 30, 40]
+
+
+@pytest.mark.parametrize('config', [None, 'ocr_scrub'])
+@pytest.mark.parametrize('plss_values', [
+    [None, '154n97w14: NE/4', np.nan],
+    [np.nan, np.nan, np.nan],
+])
+def test_filter_by_trs_missing_descriptions(config, plss_values):
+    # Missing descriptions are treated the same whether or not the rows
+    # could be prefiltered.
+    df = pd.DataFrame({'land_desc': plss_values})
+    expected_hits = [i for i, v in enumerate(plss_values) if isinstance(v, str)]
+    included = filter_by_trs(df, 'land_desc', '154n97w14', config=config)
+    assert list(included.index) == expected_hits
+    excluded = filter_by_trs(
+        df, 'land_desc', '154n97w14', config=config, include=False)
+    assert sorted(excluded.index.tolist() + expected_hits) == [0, 1, 2]
+
+
+# Output columns.
+
+def test_parse_plssdescs_dtypes():
+    parsed = pandas_tools.parse_plssdescs(PLSS_DF, 'land_desc')
+    str_dtype = pd.Series(['x']).dtype
+    for header in ('trs', 'desc', 'lots', 'qqs', 'warning_flags', 'error_flags'):
+        assert parsed[header].dtype == str_dtype, header
+    assert list(parsed['lots']) == ['L1', '', '', '', 'L2, L3']
+
+
+def test_parse_tracts_dtypes():
+    df = pd.DataFrame({'tract_desc': ['L1 L2 NE/4', 'SW/4']})
+    pandas_tools.parse_tracts(df, 'tract_desc')
+    str_dtype = pd.Series(['x']).dtype
+    for header in ('lots', 'qqs', 'warning_flags', 'error_flags'):
+        assert df[header].dtype == str_dtype, header
+    assert list(df['lots']) == ['L1, L2', '']
+    assert list(df['qqs']) == ['NE/4', 'SW/4']
+
+
+# PLSSDescCache.
+
+def test_cache_returns_same_object():
+    cache = pandas_tools.PLSSDescCache()
+    dsc = cache.get('154n97w14: NE/4', parse_qq=True)
+    assert cache.get('154n97w14: NE/4', parse_qq=True) is dsc
+    # An object with QQs parsed also serves lookups that don't need QQs.
+    assert cache.get('154n97w14: NE/4') is dsc
+    assert fake_pytrs.PARSE_COUNTS['PLSSDesc'] == 1
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_reparses_for_qqs_and_config():
+    cache = pandas_tools.PLSSDescCache()
+    no_qq = cache.get('154n97w14: NE/4')
+    assert not no_qq.parse_qq
+    with_qq = cache.get('154n97w14: NE/4', parse_qq=True)
+    assert with_qq is not no_qq and with_qq.parse_qq
+    other_config = cache.get('154n97w14: NE/4', config='n,w', parse_qq=True)
+    assert other_config is not with_qq
+    assert fake_pytrs.PARSE_COUNTS['PLSSDesc'] == 3
+
+
+def test_cache_shared_between_filter_and_parse():
+    cache = pandas_tools.PLSSDescCache()
+    filtered = filter_by_trs(
+        PLSS_DF, 'land_desc', '154n97w14', cache=cache)
+    parse_count = fake_pytrs.PARSE_COUNTS['PLSSDesc']
+    assert len(cache) == parse_count
+    parsed = pandas_tools.parse_plssdescs(
+        filtered, 'land_desc', cache=cache)
+    assert fake_pytrs.PARSE_COUNTS['PLSSDesc'] == parse_count
+    # The QQs parsed during the filter are available to the parse.
+    assert list(parsed['qqs']) == ['NE/4', 'SW/4', 'NW/4']
+
+
+def test_cache_sets_source_for_duplicate_descriptions():
+    df = pd.DataFrame(
+        {'land_desc': ['154n97w14: NE/4; 154n97w15: SW/4'] * 2 + ['155n98w01: SE/4']},
+        index=['a', 'b', 'c'])
+    cache = pandas_tools.PLSSDescCache()
+    parsed = pandas_tools.parse_plssdescs(df, 'land_desc', cache=cache)
+    assert fake_pytrs.PARSE_COUNTS['PLSSDesc'] == 2
+    assert list(parsed.index) == ['a', 'a', 'b', 'b', 'c']
+    assert list(parsed['trs']) == [
+        '154n97w14', '154n97w15', '154n97w14', '154n97w15', '155n98w01']
+
+
+# Parallel parsing.
+
+@pytest.mark.parametrize('max_workers', [0, -1, 1.5])
+def test_invalid_max_workers(max_workers):
+    with pytest.raises(ValueError, match='max_workers'):
+        pandas_tools.parse_plssdescs(
+            PLSS_DF, 'land_desc', parallel=True, max_workers=max_workers)
+    with pytest.raises(ValueError, match='max_workers'):
+        filter_by_trs(
+            PLSS_DF, 'land_desc', '154n97w14', parallel=True,
+            max_workers=max_workers)
+
+
+# The worker processes must inherit the stand-in for pytrs.
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork',
+    reason="worker processes would not use the pytrs stand-in")
+
+
+@requires_fork
+def test_parse_tracts_parallel():
+    df = pd.DataFrame({'tract_desc': ['L1 L2 NE/4', 'SW/4', '', 'L3'] * 3})
+    sequential = pandas_tools.parse_tracts(df.copy(), 'tract_desc')
+    parallel = pandas_tools.parse_tracts(
+        df.copy(), 'tract_desc', parallel=True, max_workers=2)
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+
+@requires_fork
+def test_parse_plssdescs_parallel():
+    sequential = pandas_tools.parse_plssdescs(PLSS_DF, 'land_desc')
+    parallel = pandas_tools.parse_plssdescs(
+        PLSS_DF, 'land_desc', parallel=True, max_workers=2)
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+
+@requires_fork
+@pytest.mark.parametrize('include', [True, False])
+def test_filter_by_trs_parallel(include):
+    sought = ['154n97w15', '155n98w01']
+    sequential = filter_by_trs(
+        PLSS_DF, 'land_desc', sought, include=include)
+    parallel = filter_by_trs(
+        PLSS_DF, 'land_desc', sought, include=include, parallel=True,
+        max_workers=2)
+    pd.testing.assert_frame_equal(parallel, sequential)
+
+
+# Config handling.
+
+@pytest.fixture
+def parse_configs(monkeypatch):
+    """Record the `config` passed to each new PLSSDesc."""
+    configs = []
+
+    class RecordingPLSSDesc(fake_pytrs.PLSSDesc):
+        def __init__(self, txt, config=None, **kwargs):
+            configs.append(config)
+            super().__init__(txt, config=config, **kwargs)
+
+    monkeypatch.setattr(fake_pytrs, 'PLSSDesc', RecordingPLSSDesc)
+    return configs
+
+
+@pytest.mark.parametrize('use_cache', [False, True])
+def test_caller_config_object_is_used(parse_configs, use_cache):
+    config = fake_pytrs.Config('n,w')
+    cache = pandas_tools.PLSSDescCache() if use_cache else None
+    filter_by_trs(PLSS_DF, 'land_desc', '154n97w14', config=config, cache=cache)
+    pandas_tools.parse_plssdescs(
+        PLSS_DF, 'land_desc', config=config, cache=cache)
+    pandas_tools.plssdesc_contains_trs(
+        '155n98w01: SE/4', '155n98w01', config=config, cache=cache)
+    assert parse_configs
+    assert all(cfg is config for cfg in parse_configs)
+
+
+def test_config_string_built_once(parse_configs):
+    pandas_tools.parse_plssdescs(PLSS_DF, 'land_desc', config='n,w')
+    assert len(parse_configs) == len(PLSS_DF)
+    config = parse_configs[0]
+    assert isinstance(config, fake_pytrs.Config)
+    assert config.decompile_to_text() == 'n,w'
+    assert all(cfg is config for cfg in parse_configs)